@@ -5,7 +5,8 @@ This module finds the FSD50K root folder, so the notebooks don’t need hard-cod
 paths. It supports both local usage and Google Colab (Drive-mounted) workflows.
 
 Search order (first match wins):
-1) Environment variable `FSD50K_DIR`
+1) Environment variable `FSD50K_DIR` (read at import; call
+   `refresh_fsd50k_cache()` after changing it)
 2) Repo-local: `<repo>/data/raw/FSD50K`
 3) Common Colab Drive paths:
    - `/content/drive/MyDrive/FSD50K`
@@ -14,7 +15,10 @@ Search order (first match wins):
 Main functions
 --------------
 - `find_fsd50k_root(strict=False)` → Path | None  
+- `refresh_fsd50k_cache()` → forget cached lookups (after moving data or
+  changing `FSD50K_DIR` at runtime)
 - `list_wavs(split="dev")` → list[Path]
+- `count_wavs(split="dev")` → int
 - `load_ground_truth(split="dev")` → pd.DataFrame
 - `load_vocabulary()` → pd.DataFrame
 - `print_dataset_summary()` → prints where the dataset was found and file counts
@@ -30,21 +34,39 @@ eval wavs: 10000
 
 from __future__ import annotations
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
+import functools
 import os
 
-try:
-    import pandas as pd
-except Exception:
-    pd = None  # Only needed if you call the CSV readers
-
 # Name of the environment variable that can explicitly point to FSD50K
 ENV_VAR = "FSD50K_DIR"
 
+# Subfolders that identify a valid FSD50K root (tuple → fixed probe order)
+_REQUIRED_SUBDIRS = (
+    "FSD50K.dev_audio",
+    "FSD50K.eval_audio",
+    "FSD50K.ground_truth",
+    "FSD50K.metadata",
+)
+
+
+def _lazy_import_pandas(caller: str):
+    """
+    Import `pandas` only when a CSV reader is called.
+
+    pandas is slow to import and unused by path discovery/listing, so
+    importing `src.dataio` stays cheap.
+    """
+    try:
+        import pandas as pd
+    except ImportError as e:
+        raise ImportError(f"pandas is required for {caller}(...)") from e
+    return pd
+
 
-def _candidate_roots() -> List[Path]:
+def _compute_candidate_roots() -> Tuple[Path, ...]:
     """
-    Build an **ordered** list of places to look for the FSD50K root.
+    Build an **ordered** tuple of places to look for the FSD50K root.
     The first existing path that contains the expected subfolders wins.
     """
     cands: List[Path] = []
@@ -66,22 +88,60 @@ def _candidate_roots() -> List[Path]:
     seen = set()
     out: List[Path] = []
     for p in cands:
-        if str(p) not in seen:
+        key = os.fspath(p)
+        if key not in seen:
             out.append(p)
-            seen.add(str(p))
-    return out
+            seen.add(key)
+    return tuple(out)
+
+
+# Resolved once at import (`resolve()` hits the filesystem); call
+# `refresh_fsd50k_cache()` after changing FSD50K_DIR.
+_CANDS: Tuple[Path, ...] = _compute_candidate_roots()
+
+
+def _candidate_roots() -> Tuple[Path, ...]:
+    """Return the precomputed candidate roots (see `_compute_candidate_roots`)."""
+    return _CANDS
+
+
+@functools.lru_cache(maxsize=1)
+def _find_fsd50k_root_cached() -> Path:
+    """
+    Scan the candidate locations and return the first valid FSD50K root.
+
+    Raises FileNotFoundError when nothing is found. Exceptions are never
+    cached by `lru_cache`, so only successful lookups are memoized and a
+    dataset created or mounted later is found by the next call.
+    """
+    for cand in _candidate_roots():
+        # Four direct stats, independent of how many entries the root holds
+        if cand.is_dir() and all((cand / sub).is_dir() for sub in _REQUIRED_SUBDIRS):
+            return cand
+
+    raise FileNotFoundError(
+        "Could not locate FSD50K. "
+        f"Tried: {', '.join(str(p) for p in _candidate_roots())}. "
+        f"Set {ENV_VAR} or place it under data/raw/FSD50K/ "
+        "(if you set the variable after importing src.dataio, also call "
+        "refresh_fsd50k_cache())."
+    )
 
 
 def find_fsd50k_root(strict: bool = False) -> Optional[Path]:
     """
     Try to locate the FSD50K dataset root by checking the candidate locations.
 
-    A valid root must contain these entries:
+    A valid root must contain these subfolders:
     - FSD50K.dev_audio
     - FSD50K.eval_audio
     - FSD50K.ground_truth
     - FSD50K.metadata
 
+    The first successful lookup is cached for the rest of the session; failed
+    lookups are not cached. Call `refresh_fsd50k_cache()` if the dataset is
+    moved after it was found or `FSD50K_DIR` changes.
+
     Parameters
     ----------
     strict : bool
@@ -93,26 +153,35 @@ def find_fsd50k_root(strict: bool = False) -> Optional[Path]:
     Path | None
         Path to the dataset root, or None if not found and strict=False.
     """
-    required = {
-        "FSD50K.dev_audio",
-        "FSD50K.eval_audio",
-        "FSD50K.ground_truth",
-        "FSD50K.metadata",
-    }
+    try:
+        return _find_fsd50k_root_cached()
+    except FileNotFoundError:
+        if strict:
+            raise
+        return None
 
-    for cand in _candidate_roots():
-        if cand.exists() and cand.is_dir():
-            names = {child.name for child in cand.iterdir()}
-            if required.issubset(names):
-                return cand
 
-    if strict:
-        raise FileNotFoundError(
-            "Could not locate FSD50K. "
-            f"Tried: {', '.join(str(p) for p in _candidate_roots())}. "
-            f"Set {ENV_VAR} or place it under data/raw/FSD50K/."
-        )
-    return None
+def refresh_fsd50k_cache() -> None:
+    """
+    Forget all cached lookups so the next `find_fsd50k_root()` rescans disk.
+
+    Candidate roots are recomputed too, so call this after changing
+    `FSD50K_DIR` at runtime or after moving the dataset.
+    """
+    global _CANDS
+    _CANDS = _compute_candidate_roots()
+    _find_fsd50k_root_cached.cache_clear()
+
+
+find_fsd50k_root.cache_clear = refresh_fsd50k_cache
+
+
+def _split_audio_dir(split: str) -> Path:
+    """Return `<root>/FSD50K.<split>_audio` for 'dev' or 'eval'."""
+    root = find_fsd50k_root(strict=True)
+    if split not in {"dev", "eval"}:
+        raise ValueError("split must be 'dev' or 'eval'")
+    return root / f"FSD50K.{split}_audio"
 
 
 def list_wavs(split: str = "dev") -> List[Path]:
@@ -124,11 +193,23 @@ def list_wavs(split: str = "dev") -> List[Path]:
     list[Path]
         Sorted list of file paths to *.wav files.
     """
-    root = find_fsd50k_root(strict=True)
-    if split not in {"dev", "eval"}:
-        raise ValueError("split must be 'dev' or 'eval'")
-    folder = root / f"FSD50K.{split}_audio"
-    return sorted(folder.glob("*.wav"))
+    folder = _split_audio_dir(split)
+    # scandir + suffix check is much cheaper than glob() on 20k+ entries;
+    # Path objects are only built for the final (sorted) names.
+    with os.scandir(folder) as it:
+        names = [e.name for e in it if e.name.endswith(".wav") and e.is_file()]
+    names.sort()
+    return [folder / n for n in names]
+
+
+def count_wavs(split: str = "dev") -> int:
+    """
+    Count the WAV files for a given split: 'dev' or 'eval'.
+
+    Same as `len(list_wavs(split))`, but without building or sorting a list.
+    """
+    with os.scandir(_split_audio_dir(split)) as it:
+        return sum(1 for e in it if e.name.endswith(".wav") and e.is_file())
 
 
 def load_ground_truth(split: str = "dev"):
@@ -137,8 +218,7 @@ def load_ground_truth(split: str = "dev"):
 
     Requires `pandas`. The returned DataFrame matches the official CSV columns.
     """
-    if pd is None:
-        raise ImportError("pandas is required for load_ground_truth(...)")
+    pd = _lazy_import_pandas("load_ground_truth")
     root = find_fsd50k_root(strict=True)
     gt = root / "FSD50K.ground_truth"
     csv_path = gt / ("dev.csv" if split == "dev" else "eval.csv")
@@ -151,8 +231,7 @@ def load_vocabulary():
 
     Requires `pandas`. The file maps label ids/names as provided by the dataset.
     """
-    if pd is None:
-        raise ImportError("pandas is required for load_vocabulary(...)")
+    pd = _lazy_import_pandas("load_vocabulary")
     root = find_fsd50k_root(strict=True)
     return pd.read_csv(root / "FSD50K.ground_truth" / "vocabulary.csv")
 
@@ -165,12 +244,13 @@ def print_dataset_summary() -> None:
     root = find_fsd50k_root(strict=False)
     if root is None:
         print("FSD50K not found. Set FSD50K_DIR or place at data/raw/FSD50K/")
+        print("  (after setting FSD50K_DIR at runtime, call refresh_fsd50k_cache())")
         for i, c in enumerate(_candidate_roots(), 1):
             print(f"  candidate {i}: {c}")
         return
 
-    dev_n = len(list_wavs("dev"))
-    eval_n = len(list_wavs("eval"))
+    dev_n = count_wavs("dev")
+    eval_n = count_wavs("eval")
     print(f"FSD50K root: {root}")
     print(f"dev wavs:  {dev_n}")
     print(f"eval wavs: {eval_n}")
@@ -19,8 +19,18 @@ Provided utilities
 - `frame_feature(mat, max_frames=None)` → (n_features, time’)
     Clip/pad features along the **time** axis to a fixed number of frames.
 
-- `save_numpy(array, out_path)`:
-    Save a NumPy array to disk, creating parent directories if needed.
+- `frame_feature_batch(mats, max_frames=None)` → (N, n_features, time’)
+    Clip/pad many matrices straight into one preallocated batch array.
+
+- `save_numpy(array, out_path, dtype=np.float16)`:
+    Save a NumPy array to disk (float features stored as float16 by default),
+    creating parent directories if needed.
+
+- `load_feature_mmap(path)` → np.memmap
+    Read-only, memory-mapped view of a saved `.npy` feature file.
+
+- `featurize_many(paths, out_dir, kind="logmel", ...)` → list[Path]
+    Load → featurize → frame → save for many files, in parallel processes.
 
 Quick example
 -------------
@@ -41,7 +51,10 @@ Notes
 
 from __future__ import annotations
 from pathlib import Path
-from typing import Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from typing import List, Optional, Sequence, Tuple
+import os
 import numpy as np
 
 
@@ -57,6 +70,19 @@ def _lazy_import_librosa():
     return importlib.import_module("librosa")
 
 
+@lru_cache(maxsize=8)
+def _mel_fb(sr: int, n_fft: int, n_mels: int) -> np.ndarray:
+    """
+    Mel filterbank of shape (n_mels, 1 + n_fft // 2), built once per config.
+
+    The array is shared between calls, so it is marked read-only.
+    """
+    librosa = _lazy_import_librosa()
+    fb = librosa.filters.mel(sr=sr, n_fft=n_fft, n_mels=n_mels).astype(np.float32)
+    fb.setflags(write=False)
+    return fb
+
+
 # --- I/O ----------------------------------------------------------------------
 def load_wav_mono(path: Path, sr: int = 32000) -> Tuple[np.ndarray, int]:
     """
@@ -101,8 +127,10 @@ def logmel(y: np.ndarray, sr: int, n_mels: int = 64) -> np.ndarray:
         Log-scaled mel spectrogram (dB). Uses `ref=np.max` so values are <= 0.
     """
     librosa = _lazy_import_librosa()
-    S = librosa.feature.melspectrogram(y=y, sr=sr, n_mels=n_mels)  # power mel spec
-    return librosa.power_to_db(S, ref=np.max)
+    n_fft = 2048  # librosa.feature.melspectrogram defaults
+    S = np.abs(librosa.stft(y, n_fft=n_fft, hop_length=512)) ** 2  # power spec
+    mel = _mel_fb(sr, n_fft, n_mels) @ S
+    return librosa.power_to_db(mel, ref=np.max)
 
 
 def mfcc(y: np.ndarray, sr: int, n_mfcc: int = 20) -> np.ndarray:
@@ -147,26 +175,192 @@ def frame_feature(mat: np.ndarray, max_frames: Optional[int] = None) -> np.ndarr
     Returns
     -------
     out : np.ndarray, shape (n_features, max_frames) or (n_features, time)
+        A new C-contiguous array (never shares memory with `mat`) when
+        `max_frames` is given.
     """
     if max_frames is None:
         return mat
-    n_feat, T = mat.shape
-    out = np.zeros((n_feat, max_frames), dtype=mat.dtype)
-    T_use = min(T, max_frames)
-    out[:, :T_use] = mat[:, :T_use]
+    T = mat.shape[1]
+    if T >= max_frames:
+        # Single copy of the kept columns; no zero-fill needed. Always copy,
+        # even when T == max_frames, so the result never aliases `mat`.
+        return mat[:, :max_frames].copy(order="C")
+    # np.pad writes the data once and zero-fills only the pad region; it keeps
+    # the input's memory order, so force C order (no-op for C-order input)
+    return np.ascontiguousarray(np.pad(mat, ((0, 0), (0, max_frames - T)), mode="constant"))
+
+
+def frame_feature_batch(
+    mats: Sequence[np.ndarray], max_frames: Optional[int] = None
+) -> np.ndarray:
+    """
+    Clip/pad many feature matrices and stack them into one batch array.
+
+    Equivalent to `np.stack([frame_feature(m, max_frames) for m in mats])`,
+    but writes each matrix straight into a single preallocated output
+    instead of allocating one padded copy per item.
+
+    Parameters
+    ----------
+    mats : sequence of np.ndarray, each shape (n_features, time_i)
+        Feature matrices sharing the same `n_features`.
+    max_frames : int | None
+        Output time dimension. If None, pad to the longest `time_i`.
+
+    Returns
+    -------
+    batch : np.ndarray, shape (len(mats), n_features, max_frames)
+    """
+    if len(mats) == 0:
+        raise ValueError("mats must contain at least one matrix")
+    n_feat = mats[0].shape[0]
+    if any(m.shape[0] != n_feat for m in mats):
+        raise ValueError("all matrices must have the same number of features")
+    if max_frames is None:
+        max_frames = max(m.shape[1] for m in mats)
+
+    out = np.zeros((len(mats), n_feat, max_frames), dtype=np.result_type(*mats))
+    for i, m in enumerate(mats):
+        T_use = min(m.shape[1], max_frames)
+        out[i, :, :T_use] = m[:, :T_use]
     return out
 
 
-def save_numpy(array: np.ndarray, out_path: Path) -> None:
+def save_numpy(
+    array: np.ndarray,
+    out_path: Path,
+    dtype: Optional[np.dtype] = np.float16,
+) -> None:
     """
     Save a NumPy array to `out_path` (parent directories created if missing).
 
+    Floating-point arrays are stored as `dtype` (float16 by default), which
+    halves file size for log-mel features: dB values in roughly [-80, 0] fit
+    comfortably in float16. MFCCs have a wider range and finer low-order
+    detail, so save them with `dtype=np.float32`.
+
     Parameters
     ----------
     array : np.ndarray
         Array to save.
     out_path : Path
         Destination path ending with `.npy`.
+    dtype : np.dtype | None, default=np.float16
+        Storage dtype for floating-point arrays. None (or a non-float array)
+        saves the array unchanged.
     """
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    np.save(out_path, array)
+    if dtype is not None and np.issubdtype(array.dtype, np.floating):
+        array = array.astype(dtype, copy=False)
+    # No pickle → plain header + raw buffer (C or Fortran order), loadable via mmap
+    np.save(out_path, array, allow_pickle=False)
+
+
+def load_feature_mmap(path: Path) -> np.ndarray:
+    """
+    Memory-map a `.npy` feature file written by `save_numpy` (read-only).
+
+    Pages are read from disk on access, so batching code can slice or copy
+    straight from the file without an intermediate full load.
+
+    Parameters
+    ----------
+    path : Path
+        Path to a `.npy` file.
+
+    Returns
+    -------
+    np.memmap
+        Read-only array view backed by the file.
+    """
+    return np.load(path, mmap_mode="r", allow_pickle=False)
+
+
+# --- Batch pipeline -----------------------------------------------------------
+def _featurize_one(
+    path: Path,
+    out_dir: Path,
+    kind: str,
+    sr: int,
+    n_mels: int,
+    n_mfcc: int,
+    max_frames: Optional[int],
+) -> Path:
+    """
+    Worker for `featurize_many`: one file in, one `.npy` out.
+
+    Kept at module level so it can be pickled to worker processes.
+    """
+    y, sr = load_wav_mono(path, sr=sr)
+    if kind == "logmel":
+        X, dtype = logmel(y, sr, n_mels=n_mels), np.float16
+    else:
+        X, dtype = mfcc(y, sr, n_mfcc=n_mfcc), np.float32
+    out_path = out_dir / f"{Path(path).stem}.npy"
+    save_numpy(frame_feature(X, max_frames=max_frames), out_path, dtype=dtype)
+    return out_path
+
+
+def featurize_many(
+    paths: Sequence[Path],
+    out_dir: Path,
+    kind: str = "logmel",
+    sr: int = 32000,
+    n_mels: int = 64,
+    n_mfcc: int = 20,
+    max_frames: Optional[int] = None,
+    n_workers: Optional[int] = None,
+) -> List[Path]:
+    """
+    Extract features for many audio files and save one `.npy` per file.
+
+    Each file goes through `load_wav_mono` → `logmel`/`mfcc` →
+    `frame_feature` → `save_numpy` (log-mel stored as float16, MFCC as
+    float32). Files are spread across a process pool,
+    since STFT/mel work is CPU-bound.
+
+    Parameters
+    ----------
+    paths : sequence of Path
+        Audio files to process.
+    out_dir : Path
+        Destination folder; outputs are named `<stem>.npy`.
+    kind : {"logmel", "mfcc"}, default="logmel"
+        Which feature to compute.
+    sr : int, default=32000
+        Target sample rate passed to `load_wav_mono`.
+    n_mels : int, default=64
+        Mel bins (used when `kind="logmel"`).
+    n_mfcc : int, default=20
+        MFCC coefficients (used when `kind="mfcc"`).
+    max_frames : int | None
+        Passed to `frame_feature`; None keeps the native length.
+    n_workers : int | None
+        Number of worker processes (default: `os.cpu_count()`).
+        Use 1 to run serially in the current process.
+
+    Returns
+    -------
+    list[Path]
+        Output `.npy` paths, in the same order as `paths`.
+    """
+    if kind not in {"logmel", "mfcc"}:
+        raise ValueError("kind must be 'logmel' or 'mfcc'")
+    paths = list(paths)
+    n_workers = n_workers or os.cpu_count() or 1
+    work = partial(
+        _featurize_one,
+        out_dir=Path(out_dir),
+        kind=kind,
+        sr=sr,
+        n_mels=n_mels,
+        n_mfcc=n_mfcc,
+        max_frames=max_frames,
+    )
+    if n_workers == 1 or len(paths) <= 1:
+        return [work(p) for p in paths]
+
+    # Large chunks amortize pickling/IPC; ~4 chunks per worker keeps balance
+    chunksize = max(1, len(paths) // (n_workers * 4))
+    with ProcessPoolExecutor(max_workers=n_workers) as ex:
+        return list(ex.map(work, paths, chunksize=chunksize))
@@ -3,12 +3,12 @@ Deterministic train/val split helpers.
 
 This module creates **reproducible** file lists for training/validation and
 (optionally) writes them to disk as small JSON files. It does not inspect
-file contents—only shuffles the provided list of Paths.
+file contents—only samples from the provided list of Paths.
 
 Provided functions
 ------------------
 - random_split(paths, val_ratio=0.2, seed=42) -> (train_paths, val_paths)
-    Seeded shuffle using a dedicated RNG so results are stable.
+    Seeded sampling using a dedicated RNG so results are stable.
 
 - write_split_files(train, val, out_dir)
     Save JSON lists of stringified paths: `train_files.json`, `val_files.json`.
@@ -24,16 +24,18 @@ Example
 from __future__ import annotations
 from pathlib import Path
 from typing import List, Tuple
-from src.utils import save_json, ensure_dirs
-import random
+from src.utils import save_json_paths, ensure_dirs
+import numpy as np
 
 
 def random_split(paths: List[Path], val_ratio: float = 0.2, seed: int = 42) -> Tuple[List[Path], List[Path]]:
     """
     Create a **reproducible** train/val split from a list of file paths.
 
-    The shuffle uses a *local* Random instance seeded with `seed` so the result
-    does not depend on global RNG state or other libraries.
+    Validation items are sampled without replacement by a *local* NumPy
+    Generator seeded with `seed`, so the result does not depend on global RNG
+    state or other libraries. Train keeps the input order; validation is in
+    sampled (random) order.
 
     Parameters
     ----------
@@ -55,12 +57,22 @@ def random_split(paths: List[Path], val_ratio: float = 0.2, seed: int = 42) -> T
     -----
     - Ensures at least **one** item in the validation set when `paths` is non-empty.
     - For very small datasets, this may leave `train` empty if `len(paths) == 1`.
+    - `val_ratio >= 1` puts every item in the validation set.
+    - `train` is **not shuffled**: it keeps the order of `paths`. Earlier
+      versions returned a shuffled `train`, so code taking "the first K" train
+      items now gets a different subset; shuffle it yourself if needed.
     """
-    rnd = random.Random(seed)   # local RNG → deterministic, no side effects
     items = list(paths)         # do not mutate the caller's list
-    rnd.shuffle(items)
-    n_val = max(1, int(len(items) * val_ratio)) if len(items) > 0 else 0
-    return items[n_val:], items[:n_val]
+    n = len(items)
+    n_val = min(n, max(1, int(n * val_ratio))) if n > 0 else 0  # val_ratio > 1 → all val
+    # Draw only the validation indices (partial shuffle in C) with a local
+    # Generator → deterministic, no side effects; train is the complement.
+    val_idx = np.random.default_rng(seed).choice(n, size=n_val, replace=False)
+    is_train = np.ones(n, dtype=bool)
+    is_train[val_idx] = False
+    train = [items[i] for i in np.flatnonzero(is_train).tolist()]
+    val = [items[i] for i in val_idx.tolist()]
+    return train, val
 
 
 def write_split_files(train: List[Path], val: List[Path], out_dir: Path) -> None:
@@ -81,6 +93,6 @@ def write_split_files(train: List[Path], val: List[Path], out_dir: Path) -> None
         Destination directory (created if missing).
     """
     ensure_dirs(out_dir)
-    # JSON doesn't have a Path type → stringify for portability
-    save_json([str(p) for p in train], out_dir / "train_files.json")
-    save_json([str(p) for p in val],   out_dir / "val_files.json")
+    # JSON doesn't have a Path type → written as strings for portability
+    save_json_paths(train, out_dir / "train_files.json")
+    save_json_paths(val,   out_dir / "val_files.json")
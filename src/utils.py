@@ -5,12 +5,14 @@ Project-wide utilities: paths, seeding, tiny JSON helpers, and timestamps.
   that this file lives in `<repo>/src/utils.py`. If you move it, adjust the
   `parents[1]` logic accordingly.
 
-- `set_seed()` seeds Python, NumPy, and (if available) PyTorch/TensorFlow so
-  runs are more reproducible.
+- `set_seed()` seeds Python, NumPy, and (if already imported) PyTorch/TensorFlow
+  so runs are more reproducible.
 
 - `ensure_dirs()` safely creates directories.
 
 - `save_json()` / `load_json()` are tiny wrappers around JSON I/O.
+  `save_json_paths()` writes a list of paths straight to disk. Both use
+  `orjson` when installed.
 
 - `timestamp()` generates a filesystem-friendly time string you can use
   for experiment/run folder names.
@@ -18,15 +20,37 @@ Project-wide utilities: paths, seeding, tiny JSON helpers, and timestamps.
 
 from __future__ import annotations
 from pathlib import Path
-import random, json, numpy as np
+from typing import Iterable
+import math, os, sys, random, json, numpy as np
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional: faster JSON writes; stdlib json is the fallback
+
+
+# Resolved once at import: `resolve()` canonicalizes via filesystem syscalls
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_PATHS: dict[str, Path] = {
+    "root": _REPO_ROOT,
+    "data": _REPO_ROOT / "data",
+    "raw": _REPO_ROOT / "data" / "raw",
+    "processed": _REPO_ROOT / "data" / "processed",
+    "outputs": _REPO_ROOT / "outputs",
+    "models": _REPO_ROOT / "models",
+    "notebooks": _REPO_ROOT / "notebooks",
+    "src": _REPO_ROOT / "src",
+}
+
 
 def project_paths() -> dict[str, Path]:
     """
-    Build a dictionary of common project paths relative to the **repo root**.
+    Return a dictionary of common project paths relative to the **repo root**.
 
     Assumes this file is at: <repo>/src/utils.py  → repo root = parents[1]
+    The paths are computed once at import; each call returns a fresh copy,
+    so callers may modify it freely.
 
     Returns
     -------
@@ -34,22 +58,17 @@ def project_paths() -> dict[str, Path]:
         Keys: "root", "data", "raw", "processed", "outputs", "models",
         "notebooks", "src".
     """
-    root = Path(__file__).resolve().parents[1]
-    return {
-        "root": root,
-        "data": root / "data",
-        "raw": root / "data" / "raw",
-        "processed": root / "data" / "processed",
-        "outputs": root / "outputs",
-        "models": root / "models",
-        "notebooks": root / "notebooks",
-        "src": root / "src",
-    }
+    return dict(_PATHS)
 
 
 def set_seed(seed: int = 42) -> None:
     """
-    Seed Python/NumPy and, if present, deep-learning libs for reproducibility.
+    Seed Python/NumPy and, if already imported, deep-learning libs for
+    reproducibility.
+
+    PyTorch/TensorFlow are only seeded if they are in `sys.modules` at call
+    time. Import them first, or call `set_seed` again after importing a
+    framework later in a notebook; otherwise that framework stays unseeded.
 
     Parameters
     ----------
@@ -59,23 +78,21 @@ def set_seed(seed: int = 42) -> None:
     random.seed(seed)
     np.random.seed(seed)
 
+    # Only seed frameworks that are already imported: importing them here
+    # (TensorFlow especially) costs seconds and hundreds of MB for nothing.
     # Optional: PyTorch
-    try:
-        import torch
+    torch = sys.modules.get("torch")
+    if torch is not None:
         torch.manual_seed(seed)
         torch.cuda.manual_seed_all(seed)
         # Optionally make CuDNN deterministic (slower but reproducible):
         # torch.backends.cudnn.deterministic = True
         # torch.backends.cudnn.benchmark = False
-    except Exception:
-        pass
 
     # Optional: TensorFlow
-    try:
-        import tensorflow as tf
+    tf = sys.modules.get("tensorflow")
+    if tf is not None:
         tf.random.set_seed(seed)
-    except Exception:
-        pass
 
 
 def ensure_dirs(*paths: Path) -> None:
@@ -91,9 +108,44 @@ def ensure_dirs(*paths: Path) -> None:
         p.mkdir(parents=True, exist_ok=True)
 
 
+def _has_nonfinite(obj) -> bool:
+    """Return True if `obj` contains a NaN/±Inf float (dict values/lists/tuples)."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_nonfinite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_nonfinite(v) for v in obj)
+    return False
+
+
+def _dumps_bytes(obj, check_nonfinite: bool = True) -> bytes:
+    """
+    Encode `obj` as 2-space-indented JSON bytes, via `orjson` when possible.
+
+    Falls back to stdlib `json` when orjson is missing, rejects the object
+    (e.g. ints beyond 64 bits, surrogate-escaped str), or would silently turn
+    NaN/±Inf into `null` (stdlib writes `NaN`/`Infinity` instead). Pass
+    `check_nonfinite=False` when `obj` is known to hold no floats.
+    """
+    if orjson is not None:
+        try:
+            out = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            # NaN/Inf can only hide behind a `null`; scan the object only then
+            if not check_nonfinite or b"null" not in out or not _has_nonfinite(obj):
+                return out
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
 def save_json(obj, path: Path) -> None:
     """
-    Save a Python object as pretty-printed JSON.
+    Save a Python object as pretty-printed JSON (via `orjson` when installed).
+
+    Objects containing NaN/±Inf (e.g. an undefined AUC) are written with the
+    stdlib encoder as `NaN`/`Infinity`, so they load back as floats.
 
     Parameters
     ----------
@@ -103,7 +155,30 @@ def save_json(obj, path: Path) -> None:
         Destination path; parent directories are created if needed.
     """
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(obj, indent=2))
+    path.write_bytes(_dumps_bytes(obj))
+
+
+def save_json_paths(paths: Iterable[Path], path: Path) -> None:
+    """
+    Save an iterable of paths as a JSON list of strings.
+
+    Same JSON as `save_json([str(p) for p in paths], path)`, but uses
+    `os.fspath` instead of `str`. Note that `orjson` writes non-ASCII
+    characters as raw UTF-8 rather than `\\uXXXX` escapes; `load_json` reads
+    both. Paths `orjson` rejects (e.g. names with undecodable bytes) fall
+    back to the stdlib encoder.
+
+    Parameters
+    ----------
+    paths : Iterable[Path]
+        Paths (or strings) to write.
+    path : Path
+        Destination path; parent directories are created if needed.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Encoded fully before writing, so a failure never truncates an existing file
+    # Strings only → no NaN/Inf to look for
+    path.write_bytes(_dumps_bytes([os.fspath(p) for p in paths], check_nonfinite=False))
 
 
 def load_json(path: Path):
@@ -120,7 +195,8 @@ def load_json(path: Path):
     Any
         Parsed JSON content (dict/list/...).
     """
-    return json.loads(Path(path).read_text())
+    # Bytes in → json detects UTF-8/16/32 itself, independent of the locale
+    return json.loads(Path(path).read_bytes())
 
 
 def timestamp(prefix: str = "exp") -> str: